@@ -1,27 +1,110 @@
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional, Dict, Any
 
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+from passlib.hash import pbkdf2_sha256
+
+from cache_utils import TTLCache
 
 # IMPORTANT: In a real deployment, keep this secret key safe (.env or config)
 SECRET_KEY = "super-secret-key-change-this-in-production-123456"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+
+
+class JWTError(Exception):
+    """Raised when a token is malformed, has a bad signature, or has expired."""
 
-# Password hashing context
+# Cache of already-verified tokens (SHA-256 of the token -> decoded payload),
+# so the signature check only runs on the first request made with a token.
+# A hit is only used while the token's own "exp" claim is in the future.
+TOKEN_CACHE = TTLCache(ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60, maxsize=10_000)
+
+# Password hashing
 # Switched from bcrypt to pbkdf2_sha256 to avoid bcrypt backend issues on Windows
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# passlib's handler is only used as a fallback for stored hashes that the fast
+# path below can't parse; it is called directly rather than through a
+# CryptContext so no scheme lookup happens per call.
+legacy_pwd_handler = pbkdf2_sha256
+
+# PBKDF2-SHA256 settings, matching passlib's pbkdf2_sha256 defaults so hashes
+# stay interchangeable: "$pbkdf2-sha256$<rounds>$<salt>$<checksum>"
+PBKDF2_PREFIX = "$pbkdf2-sha256$"
+PBKDF2_ROUNDS = 29000
+PBKDF2_SALT_SIZE = 16
+
+
+def _ab64_encode(data: bytes) -> str:
+    """passlib's "adapted base64": no padding, '.' instead of '+'."""
+    return base64.b64encode(data).decode("ascii").rstrip("=").replace("+", ".")
+
+
+def _ab64_decode(data: str) -> bytes:
+    data = data.replace(".", "+")
+    return base64.b64decode(data + "=" * (-len(data) % 4))
 
 
 def hash_password(password: str) -> str:
     """Hash a plain-text password."""
-    return pwd_context.hash(password)
+    salt = os.urandom(PBKDF2_SALT_SIZE)
+    checksum = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, PBKDF2_ROUNDS)
+    return f"{PBKDF2_PREFIX}{PBKDF2_ROUNDS}${_ab64_encode(salt)}${_ab64_encode(checksum)}"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain-text password against the stored hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    if not hashed_password.startswith(PBKDF2_PREFIX):
+        return legacy_pwd_handler.verify(plain_password, hashed_password)
+
+    try:
+        rounds, salt, checksum = hashed_password[len(PBKDF2_PREFIX):].split("$")
+        expected = _ab64_decode(checksum)
+        actual = hashlib.pbkdf2_hmac(
+            "sha256", plain_password.encode("utf-8"), _ab64_decode(salt), int(rounds)
+        )
+    except ValueError:
+        # Malformed hash: let passlib decide (it raises a descriptive error)
+        return legacy_pwd_handler.verify(plain_password, hashed_password)
+
+    return hmac.compare_digest(actual, expected)
+
+
+# Dedicated workers for password verification, sized to the CPU count.
+# hashlib.pbkdf2_hmac releases the GIL, so threads already run derivations on
+# all cores; a process pool would only add pickling/IPC overhead.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password() for async endpoints: runs on the password workers so
+    the event loop and FastAPI's shared threadpool stay free meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The header never changes, so it is encoded once
+_JWT_HEADER_SEGMENT = _b64url_encode(
+    json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode()
+)
 
 
 def create_access_token(
@@ -33,18 +116,78 @@ def create_access_token(
     'data' will typically include user id, role, etc.
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + (
-        expires_delta if expires_delta else timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    expires_delta = expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode["exp"] = int(time.time() + expires_delta.total_seconds())
+
+    payload_segment = _b64url_encode(
+        json.dumps(to_encode, separators=(",", ":")).encode()
     )
-    to_encode.update({"exp": expire})
+    signing_input = _JWT_HEADER_SEGMENT + b"." + payload_segment
+    signature = hmac.new(_SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _hs256_decode(token: str) -> Dict[str, Any]:
+    """
+    Verify an HS256 token and return its claims.
+
+    The algorithm is fixed, so this is just one HMAC-SHA256 over
+    "header.payload" plus the "exp" check, without jose's generic
+    key/algorithm handling.
+    """
+    try:
+        signing_input, signature_segment = token.rsplit(".", 1)
+        header_segment, payload_segment = signing_input.split(".")
+        header = json.loads(_b64url_decode(header_segment))
+        signature = _b64url_decode(signature_segment)
+    except ValueError as exc:
+        raise JWTError("Invalid token.") from exc
 
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+        raise JWTError("Invalid token algorithm.")
+
+    expected = hmac.new(_SECRET_KEY_BYTES, signing_input.encode(), hashlib.sha256).digest()
+    if not hmac.compare_digest(signature, expected):
+        raise JWTError("Signature verification failed.")
+
+    try:
+        payload = json.loads(_b64url_decode(payload_segment))
+    except ValueError as exc:
+        raise JWTError("Invalid token payload.") from exc
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid token payload.")
+
+    exp = payload.get("exp")
+    if exp is not None:
+        if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+            raise JWTError("Expiration Time claim (exp) must be a number.")
+        if exp <= time.time():
+            raise JWTError("Signature has expired.")
+
+    return payload
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
     """
     Decode and verify a JWT token. Raises JWTError if invalid/expired.
+
+    Successful verifications are cached until the token expires.
     """
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    key = hashlib.sha256(token.encode()).hexdigest()
+
+    payload = TOKEN_CACHE.get(key)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            return payload
+        TOKEN_CACHE.pop(key)
+
+    # Raises JWTError for invalid/expired tokens, which are never cached
+    payload = _hs256_decode(token)
+
+    if "exp" in payload:
+        TOKEN_CACHE.set(key, payload)
     return payload
@@ -1,29 +1,96 @@
-from sqlalchemy import create_engine
+import queue
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.pool import QueuePool
 
-# SQLite database URL (the file will be created in the backend folder)
+# SQLite database URL (the file will be created in the backend folder).
+# The backend is written for SQLite 3.35+ (RETURNING, ON CONFLICT, the PRAGMAs
+# below); other databases are not supported.
 SQLALCHEMY_DATABASE_URL = "sqlite:///./employee_performance.db"
 
+# Connections kept open in the pool, and extra ones allowed during bursts
+POOL_SIZE = 20
+MAX_OVERFLOW = 30
+
 # Create the SQLAlchemy engine (responsible for the connection to the database)
+# Connections are pooled and reused across requests instead of reopening the
+# database file (and warming its page cache) for every request.
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},  # needed only for SQLite
+    poolclass=QueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
 )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune every new SQLite connection.
+
+    - WAL lets readers keep reading while a write is in progress
+    - synchronous=NORMAL is safe with WAL and avoids an fsync per commit
+    - bigger page cache + memory-mapped I/O keep hot pages in memory
+    - foreign_keys=ON makes SQLite reject rows pointing at a missing employee,
+      even when an in-process existence check is out of date
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.close()
+
+
+def warm_pool():
+    """
+    Open POOL_SIZE connections up front and return them to the pool, so the
+    first burst of requests does not pay for connecting (and running the
+    PRAGMAs above) on the request path.
+    """
+    connections = [engine.connect() for _ in range(POOL_SIZE)]
+    for connection in connections:
+        connection.close()
+
+
 # SessionLocal is a class we will use to create database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: rows returned by INSERT/UPDATE ... RETURNING stay
+# loaded after commit instead of being re-SELECTed when the response is built.
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
 
 # Base class for our ORM models (tables will inherit from this)
 Base = declarative_base()
 
 
+# Closed sessions waiting to be handed to the next request. close() releases
+# the connection and empties the identity map, so a reused session starts
+# clean; reusing it only saves rebuilding the Session object itself.
+_idle_sessions: "queue.SimpleQueue[Session]" = queue.SimpleQueue()
+
+
 def get_db():
     """
     FastAPI dependency that provides a database session.
-    It opens a session at the start of a request and closes it when done.
+    It hands out a session at the start of a request and closes it when done.
+
+    Sessions are recycled rather than thread-local: FastAPI may run the setup,
+    the endpoint and the teardown of a request on different worker threads.
     """
-    db: Session = SessionLocal()
+    try:
+        db = _idle_sessions.get_nowait()
+    except queue.Empty:
+        db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+        _idle_sessions.put(db)
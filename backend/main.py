@@ -1,17 +1,36 @@
-from typing import List
+import hashlib
+from contextlib import asynccontextmanager
+from typing import Callable, List, Optional
 
-from fastapi import FastAPI, Depends, HTTPException, status
+import anyio.to_thread
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import bindparam, insert, inspect, lambda_stmt, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from jose import JWTError
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
-from db import Base, engine, get_db
+from db import MAX_OVERFLOW, POOL_SIZE, Base, engine, get_db, warm_pool
 import models
 import schemas
+from cache_utils import TTLCache
+from permissions import (
+    ADMIN,
+    EMPLOYEE,
+    PRIVILEGED_ROLES,
+    authorize_review_create,
+    authorize_review_delete,
+    authorize_review_list,
+    authorize_review_read,
+    authorize_review_write,
+)
 from auth_utils import (
+    JWTError,
     hash_password,
-    verify_password,
+    verify_password_async,
     create_access_token,
     decode_access_token,
 )
@@ -19,10 +38,51 @@ from auth_utils import (
 # Create all database tables (if they don't already exist)
 Base.metadata.create_all(bind=engine)
 
+# create_all() does not alter existing tables either, so add columns that were
+# added to the models after the database was created. Only plain nullable
+# columns can be added this way (existing rows get NULL); anything with a
+# constraint or server default needs a real migration.
+_inspector = inspect(engine)
+with engine.begin() as connection:
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in _inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable or column.server_default is not None or column.foreign_keys:
+                raise RuntimeError(
+                    f"Column {table.name}.{column.name} is missing from the database "
+                    "and is not a plain nullable column; add it with a migration."
+                )
+            connection.execute(text(
+                f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+                f"{column.type.compile(dialect=engine.dialect)}"
+            ))
+
+# create_all() skips tables that already exist, so also create any indexes
+# that were added to the models after an existing database was created.
+for table in Base.metadata.sorted_tables:
+    for index in table.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+# Worker threads for sync endpoints and dependencies (AnyIO's default is 40).
+# Requests mostly wait on the database, so never allow fewer in flight than
+# the connection pool can serve.
+THREADPOOL_SIZE = max(40, POOL_SIZE + MAX_OVERFLOW)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    warm_pool()
+    yield
+
+
 app = FastAPI(
     title="Employee Performance Tracker API",
     description="Backend API for managing employees, goals, performance reviews, and authentication.",
     version="0.4.0",
+    lifespan=lifespan,
 )
 
 # CORS: allow React frontend to call this API
@@ -39,9 +99,74 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# OAuth2 scheme to read "Authorization: Bearer <token>"
-from fastapi.security import APIKeyHeader
-oauth2_scheme = APIKeyHeader(name="Authorization")
+# Goal fields an employee may change on their own goals
+EMPLOYEE_GOAL_FIELDS = frozenset({"progress", "status"})
+
+# Batch size used when streaming review rows out of the database
+REVIEWS_YIELD_PER = 500
+
+# JSON serializers for the list endpoints, compiled once at import time.
+# Handlers return the encoded bytes directly, which skips FastAPI's own
+# response_model pass; response_model stays on the routes for the API docs.
+USERS_ADAPTER = TypeAdapter(List[schemas.UserOut])
+EMPLOYEES_ADAPTER = TypeAdapter(List[schemas.EmployeeOut])
+GOALS_ADAPTER = TypeAdapter(List[schemas.GoalOut])
+
+# Per-user caches of review responses (encoded JSON). Keys include the user's
+# id, role and employee_id so one user's view is never served to another, and
+# every review write clears them. The caches are per process: with several
+# workers, a write only clears the worker that handled it, so the TTL is kept
+# short to bound how long other workers can serve the old body. Repeat
+# fetches of an unchanged review are already cheap through the ETag/304 path.
+REVIEWS_LIST_CACHE = TTLCache(ttl=5)
+REVIEW_DETAIL_CACHE = TTLCache(ttl=5)
+
+# Users by id, so a client polling the API is not looked up on every request
+# once its token has been verified. Entries are detached from any session and
+# only their column attributes are read. The cache is per process: any write
+# through the API that changes a user or its employee link must clear it;
+# changes made directly in the database take effect within the TTL.
+USER_CACHE = TTLCache(ttl=5)
+
+# Employee ids known to exist, checked before every goal/review/user write that
+# references an employee. Only hits are cached (a missing id is always
+# re-checked) and deleting an employee clears it. The cache is per process, so
+# another worker can keep a stale hit for up to the TTL after a delete; the
+# database's foreign key checks (see db.py) still reject those writes.
+EMPLOYEE_EXISTS_CACHE = TTLCache(ttl=60)
+
+# Read-only list queries in Core: only the columns each response schema needs,
+# returned as plain rows, so no ORM objects are built for data that is
+# serialized straight away.
+def _list_select(model, schema):
+    return select(*(model.__table__.c[name] for name in schema.model_fields))
+
+
+USERS_SELECT = _list_select(models.User, schemas.UserOut)
+EMPLOYEES_SELECT = _list_select(models.Employee, schemas.EmployeeOut)
+GOALS_SELECT = _list_select(models.Goal, schemas.GoalOut)
+REVIEWS_SELECT = _list_select(models.PerformanceReview, schemas.ReviewOut)
+REVIEW_OUT_FIELDS = tuple(schemas.ReviewOut.model_fields)
+# Single reviews also need updated_at to build their ETag
+REVIEW_DETAIL_SELECT = REVIEWS_SELECT.add_columns(models.PerformanceReview.updated_at)
+
+# Hot lookups as cached lambda statements: the SQL is built and compiled once
+# and later executions only bind new parameter values.
+USER_BY_EMAIL = lambda_stmt(
+    lambda: select(models.User).where(models.User.email == bindparam("email"))
+)
+EMPLOYEE_ID_EXISTS = lambda_stmt(
+    lambda: select(1).where(models.Employee.id == bindparam("employee_id"))
+)
+USER_EMAIL_EXISTS = lambda_stmt(
+    lambda: select(1).where(models.User.email == bindparam("email")).limit(1)
+)
+EMPLOYEE_EMAIL_EXISTS = lambda_stmt(
+    lambda: select(1).where(models.Employee.email == bindparam("email")).limit(1)
+)
+
+# Reads "Authorization: Bearer <token>" and hands us the bare token
+bearer_scheme = HTTPBearer(auto_error=True)
 
 
 # =====================================================
@@ -49,18 +174,19 @@ oauth2_scheme = APIKeyHeader(name="Authorization")
 # =====================================================
 
 def get_current_user(
-    token: str = Depends(oauth2_scheme),
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: Session = Depends(get_db),
 ) -> models.User:
     """
     Decode JWT token and return the current user.
     Raises 401 if token is invalid, expired, or user not found.
-    """
-
-    # If the header value starts with "Bearer ", strip it so we only decode the raw token.
-    if token.lower().startswith("bearer "):
-        token = token.split(" ", 1)[1].strip()
 
+    FastAPI caches this dependency per request, so the role guards below all
+    share one token decode and one user lookup. The user is also stored on
+    request.state.user for code that doesn't go through Depends. Across
+    requests, users come from USER_CACHE.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials.",
@@ -68,60 +194,156 @@ def get_current_user(
     )
 
     try:
-        payload = decode_access_token(token)
+        payload = decode_access_token(credentials.credentials)
         user_id = payload.get("user_id")
         if user_id is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = USER_CACHE.get(user_id)
     if user is None:
-        raise credentials_exception
+        generation = USER_CACHE.generation
+        user = db.get(models.User, user_id)
+        if user is None:
+            raise credentials_exception
+        # Detach it so a rollback in this request cannot expire the attributes
+        # other requests read from the cached instance
+        db.expunge(user)
+        USER_CACHE.set(user_id, user, generation)
 
+    request.state.user = user
     return user
 
 
 
-def get_current_active_user(
-    current_user: models.User = Depends(get_current_user),
-) -> models.User:
+def require(*roles: str, detail: str = "") -> Callable[..., models.User]:
     """
-    Ensure the user is active.
+    Build a dependency that returns the current user after checking that the
+    account is active and, if roles are given, that the user has one of them.
+
+    Both checks happen in one dependency, so a route only adds a single node
+    on top of get_current_user.
     """
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user.",
-        )
-    return current_user
+    allowed = frozenset(roles)
+
+    def guard(current_user: models.User = Depends(get_current_user)) -> models.User:
+        if not current_user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user.",
+            )
+        if allowed and current_user.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail,
+            )
+        return current_user
 
+    return guard
 
-def get_current_admin(
-    current_user: models.User = Depends(get_current_active_user),
-) -> models.User:
+
+# Ensure the user is active
+get_current_active_user = require()
+
+# Ensure the user is an Admin
+get_current_admin = require(ADMIN, detail="Admin privileges required.")
+
+# Ensure the user is an Admin or Manager
+get_current_admin_or_manager = require(
+    *PRIVILEGED_ROLES, detail="Admin or Manager privileges required."
+)
+
+
+# =====================================================
+# QUERY HELPERS
+# =====================================================
+
+def _etag(data: bytes) -> str:
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def _etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
     """
-    Ensure the user is an Admin.
+    True when the client's If-None-Match already names this ETag.
     """
-    if current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin privileges required.",
-        )
-    return current_user
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in client_etags or "*" in client_etags
 
-def get_current_admin_or_manager(
-    current_user: models.User = Depends(get_current_active_user),
-) -> models.User:
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_etag_headers(etag))
+
+
+def _etag_response(request: Request, content: bytes, etag: Optional[str] = None) -> Response:
     """
-    Ensure the user is an Admin or Manager.
+    Return a JSON body with an ETag header, or an empty 304 Not Modified when
+    the client's If-None-Match already names this exact body.
+
+    The ETag is a hash of the body unless the caller passes its own.
     """
-    if current_user.role not in ("admin", "manager"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin or Manager privileges required.",
-        )
-    return current_user
+    if etag is None:
+        etag = _etag(content)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    return Response(content=content, media_type="application/json", headers=_etag_headers(etag))
+
+
+def _dump_list(adapter: TypeAdapter, rows) -> bytes:
+    """
+    Validate rows (ORM objects or Core rows) against a list schema and encode
+    them to JSON in one go.
+    """
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+def _json_list(request: Request, adapter: TypeAdapter, rows) -> Response:
+    return _etag_response(request, _dump_list(adapter, rows))
+
+
+def _review_response(
+    review: models.PerformanceReview, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Encode a review we just wrote as ReviewOut JSON. Its values came from
+    the database, so they are read straight off the instance and not passed
+    through response_model validation.
+    """
+    content = to_json({name: getattr(review, name) for name in REVIEW_OUT_FIELDS})
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+def _review_cache_key(user: models.User, *extra) -> tuple:
+    return (user.id, user.role, user.employee_id, *extra)
+
+
+def _invalidate_review_caches() -> None:
+    """
+    Drop all cached review responses; call after any write that changes reviews.
+    """
+    REVIEWS_LIST_CACHE.clear()
+    REVIEW_DETAIL_CACHE.clear()
+
+
+def _employee_exists(db: Session, employee_id: int) -> bool:
+    """
+    Check that an employee exists without loading the row.
+    """
+    if EMPLOYEE_EXISTS_CACHE.get(employee_id):
+        return True
+    generation = EMPLOYEE_EXISTS_CACHE.generation
+
+    exists = db.scalar(EMPLOYEE_ID_EXISTS, {"employee_id": employee_id}) is not None
+    if exists:
+        EMPLOYEE_EXISTS_CACHE.set(employee_id, True, generation)
+    return exists
 
 
 # =====================================================
@@ -156,43 +378,50 @@ def create_user(
     Create a new user account.
     Only Admin can create users.
     """
-    existing = db.query(models.User).filter(models.User.email == user_in.email).first()
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="A user with this email already exists.",
-        )
-
     # If linked to an employee, ensure that employee exists
     if user_in.employee_id is not None:
-        employee = (
-            db.query(models.Employee)
-            .filter(models.Employee.id == user_in.employee_id)
-            .first()
-        )
-        if not employee:
+        if not _employee_exists(db, user_in.employee_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Employee with id {user_in.employee_id} does not exist.",
             )
 
-    user = models.User(
-        name=user_in.name,
-        email=user_in.email,
-        password_hash=hash_password(user_in.password),
-        role=user_in.role,
-        is_active=user_in.is_active,
-        employee_id=user_in.employee_id,
+    duplicate_email = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="A user with this email already exists.",
+    )
+
+    # Cheap index lookup first, so a duplicate email is rejected before the
+    # password is hashed (PBKDF2 is by far the most expensive step here)
+    if db.scalar(USER_EMAIL_EXISTS, {"email": user_in.email}) is not None:
+        raise duplicate_email
+
+    # The unique index on email still rejects a duplicate inserted in the
+    # meantime: nothing is inserted and RETURNING gives no row.
+    stmt = (
+        sqlite_insert(models.User)
+        .values(
+            name=user_in.name,
+            email=user_in.email,
+            password_hash=hash_password(user_in.password),
+            role=user_in.role,
+            is_active=user_in.is_active,
+            employee_id=user_in.employee_id,
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(models.User)
     )
+    user = db.scalars(stmt).one_or_none()
+    if user is None:
+        raise duplicate_email
 
-    db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
 @app.get("/users", response_model=List[schemas.UserOut])
 def list_users(
+    request: Request,
     db: Session = Depends(get_db),
     current_admin: models.User = Depends(get_current_admin),
 ):
@@ -200,22 +429,27 @@ def list_users(
     List all users.
     Only Admin can view all users.
     """
-    users = db.query(models.User).all()
-    return users
+    users = db.execute(USERS_SELECT)
+    return _json_list(request, USERS_ADAPTER, users)
 
 
 @app.post("/auth/login", response_model=schemas.LoginResponse)
-def login(login_in: schemas.LoginRequest, db: Session = Depends(get_db)):
+async def login(login_in: schemas.LoginRequest, db: Session = Depends(get_db)):
     """
     Login with email + password.
 
     Returns:
     - access_token (JWT)
     - user info (id, name, email, role, employee_id, is_active)
+
+    Async so that the slow password check runs on the dedicated password
+    workers without holding one of FastAPI's threadpool slots.
     """
-    user = db.query(models.User).filter(models.User.email == login_in.email).first()
+    user = await run_in_threadpool(
+        lambda: db.scalars(USER_BY_EMAIL, {"email": login_in.email}).one_or_none()
+    )
 
-    if not user or not verify_password(login_in.password, user.password_hash):
+    if not user or not await verify_password_async(login_in.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
@@ -243,13 +477,15 @@ def login(login_in: schemas.LoginRequest, db: Session = Depends(get_db)):
     )
 @app.get("/auth/me", response_model=schemas.UserOut)
 def read_current_user(
+    request: Request,
     current_user: models.User = Depends(get_current_active_user),
 ):
     """
     Return the currently authenticated user (requires valid token).
     Frontend will use this after login to know who is logged in.
     """
-    return current_user
+    content = schemas.UserOut.model_validate(current_user).model_dump_json().encode()
+    return _etag_response(request, content)
 
 
 # =====================================================
@@ -262,6 +498,7 @@ def read_current_user(
 
 @app.get("/employees", response_model=List[schemas.EmployeeOut])
 def list_employees(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
@@ -272,23 +509,19 @@ def list_employees(
     - Employee: see only their own employee record (if linked)
     """
     # Admin and Manager: full list
-    if current_user.role in ("admin", "manager"):
-        employees = db.query(models.Employee).all()
-        return employees
+    if current_user.role in PRIVILEGED_ROLES:
+        employees = db.execute(EMPLOYEES_SELECT)
+        return _json_list(request, EMPLOYEES_ADAPTER, employees)
 
     # Employee: only their own record (if linked)
-    if current_user.role == "employee":
+    if current_user.role == EMPLOYEE:
         if current_user.employee_id is None:
             # No linked employee record
-            return []
-        employee = (
-            db.query(models.Employee)
-            .filter(models.Employee.id == current_user.employee_id)
-            .first()
+            return _json_list(request, EMPLOYEES_ADAPTER, [])
+        employees = db.execute(
+            EMPLOYEES_SELECT.where(models.Employee.id == current_user.employee_id)
         )
-        if not employee:
-            return []
-        return [employee]
+        return _json_list(request, EMPLOYEES_ADAPTER, employees)
 
     # Any other unknown role: deny
     raise HTTPException(
@@ -321,11 +554,11 @@ def get_employee(
         )
 
     # Admin & Manager: allowed
-    if current_user.role in ("admin", "manager"):
+    if current_user.role in PRIVILEGED_ROLES:
         return employee
 
     # Employee: only own record
-    if current_user.role == "employee":
+    if current_user.role == EMPLOYEE:
         if current_user.employee_id == employee_id:
             return employee
         raise HTTPException(
@@ -356,27 +589,26 @@ def create_employee(
     - Admin & Manager: allowed
     - Employee: not allowed
     """
-    existing = (
-        db.query(models.Employee)
-        .filter(models.Employee.email == employee_in.email)
-        .first()
+    stmt = (
+        sqlite_insert(models.Employee)
+        .values(
+            name=employee_in.name,
+            email=employee_in.email,
+            role=employee_in.role,
+            department=employee_in.department,
+            status=employee_in.status,
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(models.Employee)
     )
-    if existing:
+    employee = db.scalars(stmt).one_or_none()
+    if employee is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="An employee with this email already exists.",
         )
 
-    employee = models.Employee(
-        name=employee_in.name,
-        email=employee_in.email,
-        role=employee_in.role,
-        department=employee_in.department,
-        status=employee_in.status,
-    )
-    db.add(employee)
     db.commit()
-    db.refresh(employee)
     return employee
 
 
@@ -405,25 +637,20 @@ def update_employee(
         )
 
     if employee.email != employee_in.email:
-        existing = (
-            db.query(models.Employee)
-            .filter(models.Employee.email == employee_in.email)
-            .first()
-        )
-        if existing:
+        email_taken = db.scalar(EMPLOYEE_EMAIL_EXISTS, {"email": employee_in.email})
+        if email_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Another employee with this email already exists.",
             )
 
-    employee.name = employee_in.name
-    employee.email = employee_in.email
-    employee.role = employee_in.role
-    employee.department = employee_in.department
-    employee.status = employee_in.status
-
+    # One UPDATE statement for all fields, without ORM change tracking
+    db.execute(
+        update(models.Employee)
+        .where(models.Employee.id == employee_id)
+        .values(**employee_in.model_dump())
+    )
     db.commit()
-    db.refresh(employee)
     return employee
 
 
@@ -452,6 +679,12 @@ def delete_employee(
 
     db.delete(employee)
     db.commit()
+    EMPLOYEE_EXISTS_CACHE.clear()
+    # The linked user's employee_id was set to NULL; a cached copy would still
+    # point at the old id, which SQLite may hand to the next new employee
+    USER_CACHE.clear()
+    # The employee's reviews were deleted with it
+    _invalidate_review_caches()
     return None
 
 # =====================================================
@@ -464,6 +697,7 @@ def delete_employee(
 
 @app.get("/goals", response_model=List[schemas.GoalOut])
 def list_goals(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
@@ -473,19 +707,17 @@ def list_goals(
     - Admin & Manager: see all goals
     - Employee: see only goals linked to their employee_id
     """
-    if current_user.role in ("admin", "manager"):
-        goals = db.query(models.Goal).all()
-        return goals
+    if current_user.role in PRIVILEGED_ROLES:
+        goals = db.execute(GOALS_SELECT)
+        return _json_list(request, GOALS_ADAPTER, goals)
 
-    if current_user.role == "employee":
+    if current_user.role == EMPLOYEE:
         if current_user.employee_id is None:
-            return []
-        goals = (
-            db.query(models.Goal)
-            .filter(models.Goal.employee_id == current_user.employee_id)
-            .all()
+            return _json_list(request, GOALS_ADAPTER, [])
+        goals = db.execute(
+            GOALS_SELECT.where(models.Goal.employee_id == current_user.employee_id)
         )
-        return goals
+        return _json_list(request, GOALS_ADAPTER, goals)
 
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -512,10 +744,10 @@ def get_goal(
             detail=f"Goal with id {goal_id} not found",
         )
 
-    if current_user.role in ("admin", "manager"):
+    if current_user.role in PRIVILEGED_ROLES:
         return goal
 
-    if current_user.role == "employee":
+    if current_user.role == EMPLOYEE:
         if current_user.employee_id == goal.employee_id:
             return goal
         raise HTTPException(
@@ -546,7 +778,7 @@ def create_goal(
     - Employee: can create goals only for themselves (employee_id must match)
     """
     # If employee, enforce that they only create goals for themselves
-    if current_user.role == "employee":
+    if current_user.role == EMPLOYEE:
         if current_user.employee_id is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -557,36 +789,35 @@ def create_goal(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Employees can only create goals for themselves.",
             )
-    elif current_user.role not in ("admin", "manager"):
+    elif current_user.role not in PRIVILEGED_ROLES:
         # Any other (unknown) role: deny
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions to create goals.",
         )
 
-    employee = (
-        db.query(models.Employee)
-        .filter(models.Employee.id == goal_in.employee_id)
-        .first()
-    )
-    if not employee:
+    if not _employee_exists(db, goal_in.employee_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Employee with id {goal_in.employee_id} does not exist.",
         )
 
-    goal = models.Goal(
-        title=goal_in.title,
-        description=goal_in.description,
-        start_date=goal_in.start_date,
-        end_date=goal_in.end_date,
-        status=goal_in.status,
-        employee_id=goal_in.employee_id,
-        progress=goal_in.progress,
+    # INSERT ... RETURNING gives back the stored row in the same round-trip
+    stmt = (
+        insert(models.Goal)
+        .values(
+            title=goal_in.title,
+            description=goal_in.description,
+            start_date=goal_in.start_date,
+            end_date=goal_in.end_date,
+            status=goal_in.status,
+            employee_id=goal_in.employee_id,
+            progress=goal_in.progress,
+        )
+        .returning(models.Goal)
     )
-    db.add(goal)
+    goal = db.scalars(stmt).one()
     db.commit()
-    db.refresh(goal)
     return goal
 
 
@@ -603,68 +834,69 @@ def update_goal(
     - Admin & Manager: can update any field of any goal
     - Employee: can only update progress (and optionally status) of their own goals
     """
-    goal = db.query(models.Goal).filter(models.Goal.id == goal_id).first()
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Goal with id {goal_id} not found",
+    # Only fields that were sent (and are not null) get changed
+    fields = goal_in.model_dump(exclude_none=True)
+
+    # Employee: can only update their own goals (and only progress/status).
+    # The ownership check is part of the UPDATE itself, so the goal is not
+    # loaded first.
+    if current_user.role == EMPLOYEE:
+        fields = {k: v for k, v in fields.items() if k in EMPLOYEE_GOAL_FIELDS}
+        own_goal = (
+            models.Goal.id == goal_id,
+            models.Goal.employee_id == current_user.employee_id,
         )
-
-    # Admin & Manager: full update logic
-    if current_user.role in ("admin", "manager"):
-        if goal_in.employee_id is not None and goal_in.employee_id != goal.employee_id:
-            new_employee = (
-                db.query(models.Employee)
-                .filter(models.Employee.id == goal_in.employee_id)
-                .first()
-            )
-            if not new_employee:
+        if fields:
+            stmt = update(models.Goal).where(*own_goal).values(**fields).returning(models.Goal)
+        else:
+            stmt = select(models.Goal).where(*own_goal)
+        goal = db.scalars(stmt).one_or_none()
+
+        if goal is None:
+            # Nothing matched: tell a missing goal apart from someone else's
+            if db.get(models.Goal, goal_id) is None:
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Employee with id {goal_in.employee_id} does not exist.",
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Goal with id {goal_id} not found",
                 )
-            goal.employee_id = goal_in.employee_id
-
-        if goal_in.title is not None:
-            goal.title = goal_in.title
-        if goal_in.description is not None:
-            goal.description = goal_in.description
-        if goal_in.start_date is not None:
-            goal.start_date = goal_in.start_date
-        if goal_in.end_date is not None:
-            goal.end_date = goal_in.end_date
-        if goal_in.status is not None:
-            goal.status = goal_in.status
-        if goal_in.progress is not None:
-            goal.progress = goal_in.progress
-
-        db.commit()
-        db.refresh(goal)
-        return goal
-
-    # Employee: can only update their own goals (and only progress/status)
-    if current_user.role == "employee":
-        if current_user.employee_id != goal.employee_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You can only update your own goals.",
             )
 
-        # Only allow progress and status fields
-        if goal_in.progress is not None:
-            goal.progress = goal_in.progress
-        if goal_in.status is not None:
-            goal.status = goal_in.status
-
         db.commit()
-        db.refresh(goal)
         return goal
 
+    goal = db.query(models.Goal).filter(models.Goal.id == goal_id).first()
+    if not goal:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Goal with id {goal_id} not found",
+        )
+
     # Unknown role
-    raise HTTPException(
-        status_code=status.HTTP_403_FORBIDDEN,
-        detail="Insufficient permissions to update this goal.",
-    )
+    if current_user.role not in PRIVILEGED_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to update this goal.",
+        )
+
+    # Admin & Manager: can update any field
+    new_employee_id = fields.get("employee_id")
+    if new_employee_id is not None and new_employee_id != goal.employee_id:
+        if not _employee_exists(db, new_employee_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Employee with id {new_employee_id} does not exist.",
+            )
+
+    # One UPDATE statement for all changed fields, without ORM change tracking
+    if fields:
+        db.execute(
+            update(models.Goal).where(models.Goal.id == goal_id).values(**fields)
+        )
+    db.commit()
+    return goal
 
 
 @app.delete("/goals/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -686,7 +918,7 @@ def delete_goal(
             detail=f"Goal with id {goal_id} not found",
         )
 
-    if current_user.role not in ("admin", "manager"):
+    if current_user.role not in PRIVILEGED_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only Admin or Manager can delete goals.",
@@ -703,6 +935,7 @@ def delete_goal(
 
 @app.get("/reviews", response_model=List[schemas.ReviewOut])
 def list_reviews(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
@@ -711,29 +944,40 @@ def list_reviews(
 
     - Admin & Manager: see all reviews
     - Employee: see only reviews for their own employee_id
-    """
-    if current_user.role in ("admin", "manager"):
-        reviews = db.query(models.PerformanceReview).all()
-        return reviews
 
-    if current_user.role == "employee":
-        if current_user.employee_id is None:
-            return []
-        reviews = (
-            db.query(models.PerformanceReview)
-            .filter(models.PerformanceReview.employee_id == current_user.employee_id)
-            .all()
+    Responses are cached per user for a few seconds (see REVIEWS_LIST_CACHE).
+    """
+    authorize_review_list(current_user)
+
+    cache_key = _review_cache_key(current_user)
+    content = REVIEWS_LIST_CACHE.get(cache_key)
+    if content is not None:
+        return _etag_response(request, content)
+    generation = REVIEWS_LIST_CACHE.generation
+
+    # Reviews are the most-polled list, so it skips output validation: the
+    # rows come straight from our own table, already in ReviewOut's shape.
+    # Core rows are turned into plain dicts and encoded by pydantic-core,
+    # streaming from the database in batches.
+    stmt = REVIEWS_SELECT.execution_options(yield_per=REVIEWS_YIELD_PER)
+
+    if current_user.role in PRIVILEGED_ROLES:
+        rows = db.execute(stmt)
+    elif current_user.employee_id is None:
+        rows = []
+    else:
+        rows = db.execute(
+            stmt.where(models.PerformanceReview.employee_id == current_user.employee_id)
         )
-        return reviews
 
-    raise HTTPException(
-        status_code=status.HTTP_403_FORBIDDEN,
-        detail="Insufficient permissions to view reviews.",
-    )
+    content = to_json(row._asdict() for row in rows)
+    REVIEWS_LIST_CACHE.set(cache_key, content, generation)
+    return _etag_response(request, content)
 
 
 @app.get("/reviews/{review_id}", response_model=schemas.ReviewOut)
 def get_review(
+    request: Request,
     review_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
@@ -743,33 +987,38 @@ def get_review(
 
     - Admin & Manager: can view any review
     - Employee: can view only their own reviews
+
+    The ETag comes from the review's id and updated_at, so a client that
+    already has the current version gets a 304 without the body being built.
+    Responses are cached per user (see REVIEW_DETAIL_CACHE).
     """
-    review = (
-        db.query(models.PerformanceReview)
-        .filter(models.PerformanceReview.id == review_id)
-        .first()
-    )
-    if not review:
+    cache_key = _review_cache_key(current_user, review_id)
+    cached = REVIEW_DETAIL_CACHE.get(cache_key)
+    if cached is not None:
+        etag, content = cached
+        return _etag_response(request, content, etag)
+    generation = REVIEW_DETAIL_CACHE.generation
+
+    row = db.execute(
+        REVIEW_DETAIL_SELECT.where(models.PerformanceReview.id == review_id)
+    ).first()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Review with id {review_id} not found",
         )
 
-    if current_user.role in ("admin", "manager"):
-        return review
+    authorize_review_read(current_user, row.employee_id)
 
-    if current_user.role == "employee":
-        if current_user.employee_id == review.employee_id:
-            return review
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view your own reviews.",
-        )
+    data = row._asdict()
+    etag = _etag(f"{review_id}:{data.pop('updated_at')}".encode())
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
 
-    raise HTTPException(
-        status_code=status.HTTP_403_FORBIDDEN,
-        detail="Insufficient permissions to view this review.",
-    )
+    # Columns come straight from the DB, so skip validation
+    content = schemas.ReviewOut.model_construct(**data).model_dump_json().encode()
+    REVIEW_DETAIL_CACHE.set(cache_key, (etag, content), generation)
+    return _etag_response(request, content, etag)
 
 
 @app.post(
@@ -788,48 +1037,23 @@ def create_review(
     - Admin & Manager: can create reviews for any employee
     - Employee: can create self-evaluation reviews only for themselves
     """
-    # Employee restrictions
-    if current_user.role == "employee":
-        if current_user.employee_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You are not linked to an employee record.",
-            )
-        if review_in.employee_id != current_user.employee_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Employees can only create self-reviews for themselves.",
-            )
+    authorize_review_create(current_user, review_in.employee_id)
 
-    elif current_user.role not in ("admin", "manager"):
-        # Unknown role
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions to create reviews.",
-        )
-
-    employee = (
-        db.query(models.Employee)
-        .filter(models.Employee.id == review_in.employee_id)
-        .first()
-    )
-    if not employee:
+    if not _employee_exists(db, review_in.employee_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Employee with id {review_in.employee_id} does not exist.",
         )
 
-    review = models.PerformanceReview(
-        month=review_in.month,
-        rating=review_in.rating,
-        feedback=review_in.feedback,
-        reviewer_name=review_in.reviewer_name,
-        employee_id=review_in.employee_id,
-    )
-    db.add(review)
+    # INSERT ... RETURNING gives back the new row (with its id) in one round trip
+    review = db.scalars(
+        insert(models.PerformanceReview)
+        .values(**review_in.model_dump())
+        .returning(models.PerformanceReview)
+    ).one()
     db.commit()
-    db.refresh(review)
-    return review
+    _invalidate_review_caches()
+    return _review_response(review, status.HTTP_201_CREATED)
 
 
 @app.put("/reviews/{review_id}", response_model=schemas.ReviewOut)
@@ -845,72 +1069,56 @@ def update_review(
     - Admin & Manager: can update any review
     - Employee: can update only their own reviews (e.g., self-evaluation details)
     """
-    review = (
-        db.query(models.PerformanceReview)
-        .filter(models.PerformanceReview.id == review_id)
-        .first()
+    # Only the owner is needed for the permission check
+    employee_id = db.scalar(
+        select(models.PerformanceReview.employee_id)
+        .where(models.PerformanceReview.id == review_id)
     )
-    if not review:
+    if employee_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Review with id {review_id} not found",
         )
 
-    # Admin & Manager: full edit allowed
-    if current_user.role in ("admin", "manager"):
-        if review_in.employee_id is not None and review_in.employee_id != review.employee_id:
-            new_employee = (
-                db.query(models.Employee)
-                .filter(models.Employee.id == review_in.employee_id)
-                .first()
-            )
-            if not new_employee:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Employee with id {review_in.employee_id} does not exist.",
-                )
-            review.employee_id = review_in.employee_id
-
-        if review_in.month is not None:
-            review.month = review_in.month
-        if review_in.rating is not None:
-            review.rating = review_in.rating
-        if review_in.feedback is not None:
-            review.feedback = review_in.feedback
-        if review_in.reviewer_name is not None:
-            review.reviewer_name = review_in.reviewer_name
+    can_move = authorize_review_write(current_user, employee_id)
 
-        db.commit()
-        db.refresh(review)
-        return review
+    # Only fields that were sent (and are not null) get changed
+    updates = review_in.model_dump(exclude_none=True)
+    new_employee_id = updates.pop("employee_id", None)
 
-    # Employee: only own reviews
-    if current_user.role == "employee":
-        if current_user.employee_id != review.employee_id:
+    # Admin & Manager can also move the review to another employee. Employees
+    # can edit month, rating, feedback and reviewer_name (self-evaluation
+    # details) of their own reviews; employee_id is ignored for them.
+    if can_move and new_employee_id is not None and new_employee_id != employee_id:
+        if not _employee_exists(db, new_employee_id):
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You can only update your own reviews.",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Employee with id {new_employee_id} does not exist.",
             )
-
-        # Allow editing month, rating, feedback, reviewer_name (self-eval text)
-        if review_in.month is not None:
-            review.month = review_in.month
-        if review_in.rating is not None:
-            review.rating = review_in.rating
-        if review_in.feedback is not None:
-            review.feedback = review_in.feedback
-        if review_in.reviewer_name is not None:
-            review.reviewer_name = review_in.reviewer_name
-
-        db.commit()
-        db.refresh(review)
-        return review
-
-    # Unknown role
-    raise HTTPException(
-        status_code=status.HTTP_403_FORBIDDEN,
-        detail="Insufficient permissions to update this review.",
-    )
+        updates["employee_id"] = new_employee_id
+
+    # One UPDATE statement for all changed fields, without ORM change tracking;
+    # RETURNING hands back the updated row for the response
+    this_review = models.PerformanceReview.id == review_id
+    if updates:
+        stmt = (
+            update(models.PerformanceReview)
+            .where(this_review)
+            .values(**updates)
+            .returning(models.PerformanceReview)
+        )
+    else:
+        stmt = select(models.PerformanceReview).where(this_review)
+    review = db.scalars(stmt).one_or_none()
+    if review is None:
+        # Deleted since the permission check
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Review with id {review_id} not found",
+        )
+    db.commit()
+    _invalidate_review_caches()
+    return _review_response(review)
 
 
 @app.delete("/reviews/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -925,23 +1133,16 @@ def delete_review(
     - Admin & Manager: allowed
     - Employee: not allowed
     """
-    review = (
-        db.query(models.PerformanceReview)
-        .filter(models.PerformanceReview.id == review_id)
-        .first()
-    )
+    review = db.get(models.PerformanceReview, review_id)
     if not review:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Review with id {review_id} not found",
         )
 
-    if current_user.role not in ("admin", "manager"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only Admin or Manager can delete reviews.",
-        )
+    authorize_review_delete(current_user)
 
     db.delete(review)
     db.commit()
+    _invalidate_review_caches()
     return None
@@ -1,9 +1,17 @@
-from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, Boolean
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Boolean
 from sqlalchemy.orm import relationship
 
 from db import Base
 
 
+def _utcnow() -> datetime:
+    # Set in Python rather than with the database's CURRENT_TIMESTAMP, which
+    # only has one-second resolution on SQLite.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Employee(Base):
     __tablename__ = "employees"
 
@@ -47,7 +55,7 @@ class Goal(Base):
     # Progress tracking, 0–100 (% of goal completed)
     progress = Column(Integer, nullable=False, default=0)
 
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False, index=True)
 
     # Relationships
     employee = relationship("Employee", back_populates="goals")
@@ -63,7 +71,12 @@ class PerformanceReview(Base):
     feedback = Column(Text, nullable=True)
     reviewer_name = Column(String(100), nullable=False)
 
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
+    # Indexed for the employee-scoped review list. On SQLite every index entry
+    # also holds the rowid (id), so entries are already in (employee_id, id) order.
+    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False, index=True)
+
+    # Last time the review was created or changed (UTC); used for its ETag
+    updated_at = Column(DateTime, nullable=True, default=_utcnow, onupdate=_utcnow)
 
     # Relationships
     employee = relationship("Employee", back_populates="reviews")
@@ -88,6 +101,6 @@ class User(Base):
     is_active = Column(Boolean, nullable=False, default=True)
 
     # Optional link to Employee row
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=True)
+    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=True, index=True)
 
     employee = relationship("Employee", back_populates="user")
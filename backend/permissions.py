@@ -0,0 +1,105 @@
+"""
+Role checks for performance reviews.
+
+Each helper returns None when the user is allowed and raises the HTTPException
+the endpoint should answer with otherwise. They do no I/O: callers pass in the
+review's employee_id after loading it.
+
+The helpers are typed against the small ReviewUser protocol rather than the
+ORM model, so the module passes `mypy permissions.py` and can be compiled with
+`mypyc permissions.py` (run in backend/). Python imports the compiled module
+when it is present and this file otherwise.
+"""
+
+from typing import Optional, Protocol
+
+from fastapi import HTTPException, status
+
+# User roles ('admin' | 'manager' | 'employee')
+ADMIN = "admin"
+MANAGER = "manager"
+EMPLOYEE = "employee"
+# Roles that can see and manage every employee, goal and review
+PRIVILEGED_ROLES = frozenset({ADMIN, MANAGER})
+
+
+class ReviewUser(Protocol):
+    """
+    The parts of models.User the checks read.
+    """
+
+    @property
+    def role(self) -> str: ...
+
+    @property
+    def employee_id(self) -> Optional[int]: ...
+
+
+def _forbidden(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+def authorize_review_list(user: ReviewUser) -> None:
+    """
+    Admin & Manager see every review, Employee only their own (the caller
+    filters by employee_id). Any other role is denied.
+    """
+    role = user.role
+    if role not in PRIVILEGED_ROLES and role != EMPLOYEE:
+        raise _forbidden("Insufficient permissions to view reviews.")
+
+
+def authorize_review_read(user: ReviewUser, review_employee_id: int) -> None:
+    """
+    Admin & Manager can view any review, Employee only their own.
+    """
+    role = user.role
+    if role == EMPLOYEE:
+        if user.employee_id != review_employee_id:
+            raise _forbidden("You can only view your own reviews.")
+    elif role not in PRIVILEGED_ROLES:
+        raise _forbidden("Insufficient permissions to view this review.")
+
+
+def authorize_review_create(user: ReviewUser, employee_id: int) -> None:
+    """
+    Admin & Manager can create reviews for any employee; Employee can only
+    create self-evaluations.
+    """
+    role = user.role
+    if role == EMPLOYEE:
+        user_employee_id = user.employee_id
+        if user_employee_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You are not linked to an employee record.",
+            )
+        if employee_id != user_employee_id:
+            raise _forbidden("Employees can only create self-reviews for themselves.")
+    elif role not in PRIVILEGED_ROLES:
+        raise _forbidden("Insufficient permissions to create reviews.")
+
+
+def authorize_review_write(user: ReviewUser, review_employee_id: int) -> bool:
+    """
+    Admin & Manager can update any review, Employee only their own.
+
+    Returns True when the user may also move the review to another employee
+    (Admin & Manager); Employees' employee_id changes are ignored.
+    """
+    role = user.role
+    if role in PRIVILEGED_ROLES:
+        return True
+    if role == EMPLOYEE:
+        if user.employee_id != review_employee_id:
+            raise _forbidden("You can only update your own reviews.")
+        return False
+    raise _forbidden("Insufficient permissions to update this review.")
+
+
+def authorize_review_delete(user: ReviewUser) -> None:
+    """
+    Only Admin & Manager can delete reviews.
+    """
+    if user.role not in PRIVILEGED_ROLES:
+        raise _forbidden("Only Admin or Manager can delete reviews.")